@@ -8,21 +8,24 @@ from ..crud.user import get_user_by_username
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def get_current_user_claims(token: str = Depends(oauth2_scheme)) -> dict:
+    """Verified token claims, for routes that don't need the User row"""
     payload = decode_access_token(token)
-    if payload is None:
-        raise credentials_exception
-    username: str = payload.get("sub")
-    if username is None:
-        raise credentials_exception
-    user = get_user_by_username(db, username=username)
+    if payload is None or payload.get("sub") is None:
+        raise _credentials_exception()
+    return payload
+
+def get_current_user(payload: dict = Depends(get_current_user_claims), db: Session = Depends(get_db)):
+    user = get_user_by_username(db, username=payload["sub"])
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
 
 def get_current_active_user(current_user = Depends(get_current_user)):
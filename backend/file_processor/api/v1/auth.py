@@ -1,12 +1,11 @@
-from datetime import timedelta
-
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from ...core.security import verify_password, create_access_token
+from ...core.security import verify_password, create_access_token, ACCESS_TOKEN_EXPIRE
 from ...core.dependencies import get_db
-from ...crud.user import get_user_by_username, create_user
+from ...crud.user import get_user_by_username, username_exists, email_exists, create_user
 from ...schemas.user import UserCreate
 
 router = APIRouter()
@@ -16,15 +15,21 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     user = get_user_by_username(db, form_data.username)
     if not user or not verify_password(form_data.password, user.hashed_password):
         raise HTTPException(status_code=400, detail="Incorrect username or password")
-    access_token_expires = timedelta(minutes=30)
     access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
+        data={"sub": user.username, "uid": user.id, "roles": user.roles},
+        expires_delta=ACCESS_TOKEN_EXPIRE
     )
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.post("/register")
 def register(user: UserCreate, db: Session = Depends(get_db)):
-    db_user = get_user_by_username(db, user.username)
-    if db_user:
-        raise HTTPException(status_code=400, detail="Username already registered")
-    return create_user(db, user)
\ No newline at end of file
+    # Let the unique constraints reject duplicates; only look up which one on conflict
+    try:
+        return create_user(db, user)
+    except IntegrityError:
+        db.rollback()
+        if username_exists(db, user.username):
+            raise HTTPException(status_code=400, detail="Username already registered") from None
+        if email_exists(db, user.email):
+            raise HTTPException(status_code=400, detail="Email already registered") from None
+        raise
\ No newline at end of file
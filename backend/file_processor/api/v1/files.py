@@ -1,11 +1,9 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
 
-from ...api.deps import get_current_user
-from ...core.dependencies import get_db
+from ...api.deps import get_current_user_claims
 
 router = APIRouter()
 
 @router.get("/")
-def get_files(db: Session = Depends(get_db), current_user = Depends(get_current_user)):
+def get_files(claims: dict = Depends(get_current_user_claims)):
     return {"files": []}
\ No newline at end of file
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -11,9 +13,15 @@ class Settings(BaseSettings):
     encryption_key: str = "dev-encryption-key"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    bcrypt_rounds: int = 12
 
     # Database
     database_url: str = "sqlite:///./app.db"
+    database_pool_size: int = 20
+    database_max_overflow: int = 20
+    database_pool_timeout: int = 10
+    database_pool_recycle: int = 1800
+    database_query_cache_size: int = 1200
 
     # Redis
     redis_url: str = "redis://localhost:6379"
@@ -23,12 +31,17 @@ class Settings(BaseSettings):
     processed_dir: str = "./processed"
 
     # CORS
-    allowed_origins: list[str] = ["http://localhost:3000"]
+    allowed_origins: tuple[str, ...] = ("http://localhost:3000",)
 
     # External services
     sentry_dsn: str = ""
 
     class Config:
         env_file = ".env"
+        frozen = True
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -1,36 +1,61 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
 
+import bcrypt
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from .config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+ACCESS_TOKEN_EXPIRE = timedelta(minutes=settings.access_token_expire_minutes)
+
+def _password_bytes(password: str) -> bytes:
+    # bcrypt only uses the first 72 bytes; truncate like passlib did so existing hashes still verify
+    return password.encode("utf-8")[:72]
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(_password_bytes(plain_password), hashed_password.encode("utf-8"))
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(_password_bytes(password), bcrypt.gensalt(rounds=settings.bcrypt_rounds)).decode("utf-8")
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+    expire = datetime.utcnow() + (expires_delta or ACCESS_TOKEN_EXPIRE)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
     return encoded_jwt
 
+# Verified payloads keyed by token digest, kept until the token's own expiry
+TOKEN_CACHE_SIZE = 4096
+_token_cache: "OrderedDict[bytes, dict]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
 def decode_access_token(token: str) -> Optional[dict]:
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+        if payload is not None:
+            if payload["exp"] > time.time():
+                _token_cache.move_to_end(key)
+                return dict(payload)
+            del _token_cache[key]
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        return payload
     except JWTError:
         return None
 
+    if isinstance(payload.get("exp"), (int, float)):
+        with _token_cache_lock:
+            _token_cache[key] = payload
+            if len(_token_cache) > TOKEN_CACHE_SIZE:
+                _token_cache.popitem(last=False)
+    return dict(payload)
+
 # RBAC functions
 def check_permission(user_roles: list[str], required_role: str) -> bool:
     # Simple role check, can be extended
@@ -10,6 +10,12 @@ def get_user(db: Session, user_id: int):
 def get_user_by_username(db: Session, username: str):
     return db.query(User).filter(User.username == username).first()
 
+def username_exists(db: Session, username: str) -> bool:
+    return db.query(db.query(User.id).filter(User.username == username).exists()).scalar()
+
+def email_exists(db: Session, email: str) -> bool:
+    return db.query(db.query(User.id).filter(User.email == email).exists()).scalar()
+
 def create_user(db: Session, user: UserCreate):
     hashed_password = get_password_hash(user.password)
     db_user = User(username=user.username, email=user.email, hashed_password=hashed_password, roles=user.roles)
@@ -4,7 +4,23 @@ from sqlalchemy.orm import sessionmaker
 
 from .core.config import settings
 
-engine = create_engine(settings.database_url, connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {})
+if "sqlite" in settings.database_url:
+    engine = create_engine(
+        settings.database_url,
+        connect_args={"check_same_thread": False},
+        query_cache_size=settings.database_query_cache_size,
+    )
+else:
+    # Size the pool for the threadpool workers and drop dead connections before use
+    engine = create_engine(
+        settings.database_url,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=True,
+        query_cache_size=settings.database_query_cache_size,
+    )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
\ No newline at end of file
@@ -1,5 +1,7 @@
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
 from .core.config import settings
 from .database import engine, Base
@@ -7,21 +9,28 @@ from .api.routers import api_router
 
 Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title=settings.app_name, version=settings.version)
+# ORJSONResponse is deprecated from FastAPI 0.143, which serialises response models with
+# Pydantic directly; drop it once the routes declare response models
+app = FastAPI(title=settings.app_name, version=settings.version, default_response_class=ORJSONResponse)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.allowed_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Server-to-server deployments leave allowed_origins empty and skip the CORS layer
+if settings.allowed_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.allowed_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 app.include_router(api_router, prefix="/api/v1")
 
+_HEALTH_BODY = orjson.dumps({"status": "ok"})
+
+# async: no I/O here, so skip the threadpool hop FastAPI makes for plain def endpoints
 @app.get("/health")
-def health():
-    return {"status": "ok"}
+async def health():
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,19 +1,33 @@
 import re
 from typing import Dict, Any, List
 
+# Compiled once at import; _extract_pattern calls the Pattern methods directly
+PATTERNS = {
+    'email': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    'phone': re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),
+    'ssn': re.compile(r'\b\d{3}-\d{2}-\d{4}\b'),
+    'credit_card': re.compile(r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b')
+}
+
 class Extractor:
     """Data extraction service for various file types"""
 
     def __init__(self):
-        self.patterns = {
-            'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            'phone': r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-            'ssn': r'\b\d{3}-\d{2}-\d{4}\b',
-            'credit_card': r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b'
-        }
+        self.patterns = dict(PATTERNS)
 
     def extract_text(self, content: str) -> Dict[str, Any]:
         """Extract structured data from text content"""
+        # Binary files and images arrive with no text; skip the pattern scans
+        if not content:
+            return {
+                'emails': [],
+                'phones': [],
+                'ssns': [],
+                'credit_cards': [],
+                'word_count': 0,
+                'character_count': 0
+            }
+
         extracted = {
             'emails': self._extract_pattern(content, 'email'),
             'phones': self._extract_pattern(content, 'phone'),
@@ -31,8 +45,13 @@ class Extractor:
         if not pattern:
             return []
 
-        matches = re.findall(pattern, text)
-        return list(set(matches))  # Remove duplicates
+        # re.findall(Pattern) misses re's cache on every call, so use the Pattern directly;
+        # custom entries may still be plain strings
+        if isinstance(pattern, re.Pattern):
+            matches = pattern.findall(text)
+        else:
+            matches = re.findall(pattern, text)
+        return list(dict.fromkeys(matches))  # Remove duplicates, keep first-seen order
 
     def extract_metadata(self, file_info: Dict[str, Any]) -> Dict[str, Any]:
         """Extract metadata based on file type"""
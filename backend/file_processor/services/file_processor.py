@@ -1,13 +1,36 @@
 import os
+from types import MappingProxyType
 from typing import Dict, Any
 from pathlib import Path
 
+SUPPORTED_FORMATS = frozenset({
+    'pdf', 'docx', 'txt', 'jpg', 'png', 'mp4', 'mp3', 'zip'
+})
+
+def _build_extension_types() -> Dict[str, str]:
+    """Reverse index from extension to file type, first match wins"""
+    index = {}
+    for file_type, extensions in (
+        ('document', ('pdf', 'docx', 'txt')),
+        ('image', ('jpg', 'png', 'gif')),
+        ('video', ('mp4', 'avi', 'mov'))
+    ):
+        for extension in extensions:
+            index.setdefault(extension, file_type)
+    return index
+
+# Built once at import and shared read-only by every FileProcessor
+EXTENSION_TYPES = MappingProxyType(_build_extension_types())
+
 class FileProcessor:
     """Main file processing service"""
 
     def __init__(self):
-        self.supported_formats = {
-            'pdf', 'docx', 'txt', 'jpg', 'png', 'mp4', 'mp3', 'zip'
+        self.supported_formats = SUPPORTED_FORMATS
+        self._type_handlers = {
+            'document': self._process_document,
+            'image': self._process_image,
+            'video': self._process_video
         }
 
     def process_file(self, file_path: str) -> Dict[str, Any]:
@@ -18,12 +41,9 @@ class FileProcessor:
         file_info = self._get_file_info(file_path)
 
         # Basic processing based on file type
-        if file_info['extension'] in ['pdf', 'docx', 'txt']:
-            file_info.update(self._process_document(file_path))
-        elif file_info['extension'] in ['jpg', 'png', 'gif']:
-            file_info.update(self._process_image(file_path))
-        elif file_info['extension'] in ['mp4', 'avi', 'mov']:
-            file_info.update(self._process_video(file_path))
+        file_type = EXTENSION_TYPES.get(file_info['extension'])
+        if file_type:
+            file_info.update(self._type_handlers[file_type](file_path))
 
         return file_info
 
@@ -31,13 +51,14 @@ class FileProcessor:
         """Get basic file information"""
         path = Path(file_path)
         stat = path.stat()
+        extension = path.suffix.lower().lstrip('.')
 
         return {
             'filename': path.name,
-            'extension': path.suffix.lower().lstrip('.'),
+            'extension': extension,
             'size': stat.st_size,
             'modified_time': stat.st_mtime,
-            'is_supported': path.suffix.lower().lstrip('.') in self.supported_formats
+            'is_supported': extension in self.supported_formats
         }
 
     def _process_document(self, file_path: str) -> Dict[str, Any]:
@@ -44,7 +44,7 @@ class Sorter:
                     # Handle callable conditions (like lambda functions)
                     if not values(file_info[key]):
                         return False
-                elif isinstance(values, list):
+                elif isinstance(values, (list, tuple, set, frozenset)):
                     if file_info[key] not in values:
                         return False
                 elif file_info[key] != values:
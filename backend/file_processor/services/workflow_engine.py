@@ -7,6 +7,12 @@ class WorkflowEngine:
 
     def __init__(self):
         self.workflows = {}
+        self._step_handlers = {
+            'process_file': self._step_process_file,
+            'extract_metadata': self._step_extract_metadata,
+            'sort_file': self._step_sort_file,
+            'validate': self._step_validate
+        }
 
     def create_workflow(self, name: str, steps: List[Dict]) -> str:
         """Create a new workflow"""
@@ -55,17 +61,12 @@ class WorkflowEngine:
         step_type = step.get('type')
         step_name = step.get('name', 'unnamed_step')
 
-        if step_type == 'process_file':
-            return self._step_process_file(data)
-        elif step_type == 'extract_metadata':
-            return self._step_extract_metadata(data)
-        elif step_type == 'sort_file':
-            return self._step_sort_file(data)
-        elif step_type == 'validate':
-            return self._step_validate(data)
-        else:
+        handler = self._step_handlers.get(step_type)
+        if handler is None:
             return {'status': 'skipped', 'reason': f'Unknown step type: {step_type}'}
 
+        return handler(data)
+
     def _step_process_file(self, data: Dict) -> Dict[str, Any]:
         """Process file step"""
         return {
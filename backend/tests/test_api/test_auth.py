@@ -57,6 +57,22 @@ def test_register_duplicate_username(client: TestClient):
     assert response.status_code == 400
     assert "Username already registered" in response.json()["detail"]
 
+def test_register_duplicate_email(client: TestClient):
+    client.post("/api/v1/auth/register", json={
+        "username": "dupemail1",
+        "email": "dupemail@example.com",
+        "password": "pass",
+        "roles": "user"
+    })
+    response = client.post("/api/v1/auth/register", json={
+        "username": "dupemail2",
+        "email": "dupemail@example.com",
+        "password": "pass",
+        "roles": "user"
+    })
+    assert response.status_code == 400
+    assert "Email already registered" in response.json()["detail"]
+
 def test_admin_login_success(client: TestClient, admin_token):
     assert admin_token is not None
 
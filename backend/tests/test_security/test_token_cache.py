@@ -0,0 +1,39 @@
+import time
+from datetime import datetime, timedelta
+
+from jose import jwt
+
+from file_processor.core.config import settings
+from file_processor.core.security import create_access_token, decode_access_token
+
+
+def test_expired_token_is_not_served_from_cache():
+    token = create_access_token({"sub": "expiring"}, expires_delta=timedelta(seconds=1))
+    assert decode_access_token(token)["sub"] == "expiring"
+
+    time.sleep(2)
+    assert decode_access_token(token) is None
+
+def test_mutating_payload_does_not_change_cache():
+    token = create_access_token({"sub": "copyuser"})
+    payload = decode_access_token(token)
+    payload["sub"] = "someone-else"
+
+    assert decode_access_token(token)["sub"] == "copyuser"
+
+def test_tampered_token_is_not_served_from_cache():
+    token = create_access_token({"sub": "alice"})
+    other = create_access_token({"sub": "mallory"})
+    assert decode_access_token(token)["sub"] == "alice"
+
+    # Cached alice token's header and signature around mallory's claims
+    header, _, signature = token.split(".")
+    forged = ".".join((header, other.split(".")[1], signature))
+    assert decode_access_token(forged) is None
+
+    wrong_key = jwt.encode(
+        {"sub": "alice", "exp": datetime.utcnow() + timedelta(minutes=5)},
+        "not-the-secret-key",
+        algorithm=settings.algorithm
+    )
+    assert decode_access_token(wrong_key) is None
@@ -69,4 +69,27 @@ def test_extract_metadata_image():
 
     result = extractor.extract_metadata(file_info)
     assert 'extracted_data' in result
-    assert 'resolution' in result['extracted_data']
\ No newline at end of file
+    assert 'resolution' in result['extracted_data']
+
+def test_custom_string_pattern():
+    extractor = Extractor()
+    extractor.patterns['zip'] = r'\b\d{5}\b'
+    text = "Ship to 90210"
+
+    assert extractor._extract_pattern(text, 'zip') == ['90210']
+
+def test_extract_empty_text():
+    extractor = Extractor()
+
+    result = extractor.extract_text("")
+    assert result['emails'] == []
+    assert result['credit_cards'] == []
+    assert result['word_count'] == 0
+    assert result['character_count'] == 0
+
+def test_extract_deduplicates_in_order():
+    extractor = Extractor()
+    text = "b@example.com a@example.com b@example.com"
+
+    result = extractor.extract_text(text)
+    assert result['emails'] == ['b@example.com', 'a@example.com']
@@ -64,4 +64,21 @@ def test_process_unsupported_file():
         assert result['extension'] == 'xyz'
         assert result['is_supported'] is False
     finally:
-        os.unlink(temp_file)
\ No newline at end of file
+        os.unlink(temp_file)
+
+def test_process_video_file():
+    processor = FileProcessor()
+
+    # gif/avi/mov are dispatched by type even though they aren't listed as supported
+    with tempfile.NamedTemporaryFile(suffix='.mov', delete=False) as f:
+        f.write(b'fake video data')
+        temp_file = f.name
+
+    try:
+        result = processor.process_file(temp_file)
+
+        assert result['extension'] == 'mov'
+        assert result['is_supported'] is False
+        assert result['type'] == 'video'
+    finally:
+        os.unlink(temp_file)
@@ -53,4 +53,18 @@ def test_create_rule():
 
     assert rule['name'] == 'Test Rule'
     assert rule['condition'] == {'extension': ['test']}
-    assert rule['category'] == 'test_category'
\ No newline at end of file
+    assert rule['category'] == 'test_category'
+
+def test_set_condition():
+    sorter = Sorter()
+    rule = sorter.create_rule('Archives', {'extension': frozenset({'zip', 'tar'})}, 'archives')
+
+    assert sorter.sort_file({'extension': 'zip'}, [rule]) == 'archives'
+    assert sorter.sort_file({'extension': 'rar'}, [rule]) == 'misc'
+
+def test_default_rules_are_per_instance():
+    first = Sorter()
+    second = Sorter()
+    first.default_rules[0]['condition']['extension'].append('md')
+
+    assert second.sort_file({'extension': 'md'}) == 'misc'
@@ -0,0 +1,31 @@
+import pytest
+
+from file_processor.services.workflow_engine import WorkflowEngine
+
+
+def test_execute_known_steps():
+    engine = WorkflowEngine()
+    workflow_id = engine.create_workflow('Pipeline', [
+        {'name': 'process', 'type': 'process_file'},
+        {'name': 'sort', 'type': 'sort_file'}
+    ])
+
+    result = engine.execute_workflow(workflow_id, {'extension': 'pdf'})
+    assert result['status'] == 'completed'
+    assert result['final_result']['file_type_detected'] == 'pdf'
+    assert result['final_result']['category'] == 'documents'
+    assert engine.get_workflow_status(workflow_id)['status'] == 'completed'
+
+def test_unknown_step_is_skipped():
+    engine = WorkflowEngine()
+    workflow_id = engine.create_workflow('Pipeline', [{'name': 'odd', 'type': 'transcode'}])
+
+    result = engine.execute_workflow(workflow_id, {})
+    step_result = result['steps_executed'][0]['result']
+    assert step_result['status'] == 'skipped'
+    assert 'transcode' in step_result['reason']
+
+def test_execute_missing_workflow():
+    engine = WorkflowEngine()
+    with pytest.raises(ValueError):
+        engine.execute_workflow('wf_404', {})